@@ -9,18 +9,72 @@ Ease of use is provided by mapping Solr Handlers to methods making it RPC like.
 import asyncio
 import json
 import logging
+import random
 import re
 import typing
 import urllib.parse
 from typing import TYPE_CHECKING
 
 import aiohttp
-import bleach
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps  # pylint: disable=no-member
+    _json_loads = orjson.loads  # pylint: disable=no-member
+except ImportError:  # orjson is an optional speedup for (de)serializing JSON
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        """Serialize obj to JSON encoded bytes."""
+        return json.dumps(obj).encode("utf-8")
+
+
+try:
+    import aiodns
+except ImportError:  # aiodns is an optional speedup for resolving hosts
+    aiodns = None
+
+try:
+    import ijson
+except ImportError:  # ijson is only needed to stream query results
+    ijson = None
 
 __version__ = "5.0.2"
 
 LOGGER = logging.getLogger("aiosolr")
 
+# Params that Solr accepts multiple times in a URL query string
+_MULTI_VALUED_PARAMS = ("fq", "facet.field", "boost")
+# Params that take a list of values separated by spaces instead of commas
+_SPACE_SEPARATED_PARAMS = frozenset(("pf", "pf2", "pf3", "qf"))
+
+# Default request headers, these must never be mutated
+_JSON_HEADERS = {"Accept": "application/json"}
+_JSON_BODY_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
+
+# Default find_and_replace of clean, escapes field separators and turns pipes into spaces
+_FIND_AND_REPLACE = ((":", r"\:"), ("|", " "))
+
+# Regexes used when cleaning queries, compiled once at import
+_HTTP_RE = re.compile(r"http\S+")
+_REMOVE_CHARS = r'[\"\&\!\(\)\{\}\[\]\^"~\?\\;#,]'
+# Translate tables deleting the same chars as _REMOVE_CHARS, with and without wildcards
+_REMOVE_CHARS_TABLE = str.maketrans("", "", '"&!(){}[]^~?\\;#,')
+_REMOVE_CHARS_WILDCARD_TABLE = str.maketrans("", "", '"&!(){}[]^~?\\;#,*')
+# C0 control chars html parsers (and so bleach) don't pass through, only tab and newline are kept.
+# Carriage returns become newlines as in html, other control chars are removed.
+_CONTROL_CHARS = frozenset(map(chr, range(32))) - {"\t", "\n"}
+_CONTROL_CHARS_TABLE = str.maketrans({char: None for char in _CONTROL_CHARS} | {"\r": "\n"})
+# Every char that _strip_html can change
+_HTML_SPECIAL_CHARS = frozenset("<>&") | _CONTROL_CHARS
+# Every char that clean's default removal, find_and_replace and html stripping can change
+_CLEAN_SPECIAL_CHARS = frozenset('"&!(){}[]^~?\\;#,*:|<>%') | _CONTROL_CHARS
+# Start/end tags, comments and doctypes, but not a bare "<" as in "1 < 2"
+_HTML_TAG_RE = re.compile(r"<[a-zA-Z/!?][^>]*>")
+# An ampersand that does not already start a character reference
+_BARE_AMPERSAND_RE = re.compile(r"&(?!(?:[a-zA-Z][a-zA-Z0-9]*|#[0-9]+|#[xX][0-9a-fA-F]+);)")
+
 
 class SolrError(Exception):
     """Base class for exceptions in this module."""
@@ -37,6 +91,16 @@ class SolrError(Exception):
 class Response:
     """Response class."""
 
+    __slots__ = (
+        "data",
+        "doc",
+        "docs",
+        "grouped",
+        "more_like_this",
+        "status",
+        "spelling_suggestions",
+    )
+
     def __init__(self, data, status):
         self.data = data
         self.doc = {}
@@ -55,7 +119,7 @@ class Response:
             mlt_data = data.get("moreLikeThis", {})
 
             if mlt_data:
-                mlt_data_key = list(mlt_data.keys())[0]
+                mlt_data_key = next(iter(mlt_data))
                 self.more_like_this = mlt_data[mlt_data_key].get("docs", [])
 
             spellcheck = data.get("spellcheck", {})
@@ -68,10 +132,12 @@ class Response:
                 self.spelling_suggestions.append(spellcheck["collations"][1])
 
             # First element is the original query, 2nd element should be a dict of suggestions
+            seen = set(self.spelling_suggestions)
             for solr_suggs in spellcheck.get("suggestions", []):
                 if isinstance(solr_suggs, dict) and "suggestion" in solr_suggs:
                     for sugg in solr_suggs["suggestion"]:
-                        if sugg not in self.spelling_suggestions:
+                        if sugg not in seen:
+                            seen.add(sugg)
                             self.spelling_suggestions.append(sugg)
 
     def get(self, name, default=None):
@@ -83,7 +149,14 @@ class Response:
 class Client:  # pylint: disable=too-many-instance-attributes
     """Class representing a client connection to Solr."""
 
-    def __init__(
+    # Solr response writer (wt param), only json is supported for now
+    response_writer = "json"
+
+    # ClientSessions shared by clients created with shared_session=True, keyed by event loop.
+    # Held strongly so the session outlives its clients until close_shared_session is called.
+    _shared_sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+
+    def __init__(  # pylint: disable=too-many-locals
         self,
         *,
         collection="",
@@ -93,10 +166,15 @@ class Client:  # pylint: disable=too-many-instance-attributes
         port="80",
         scheme="http",
         read_timeout: typing.Optional[int] = None,
+        shared_session=False,
         write_timeout: typing.Optional[int] = None,
         client_timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(sock_connect=1, sock_read=3),
         trace_configs: typing.Optional[list[aiohttp.TraceConfig]] = None,
         ttl_dns_cache=3600,
+        connection_limit=100,
+        connection_limit_per_host=0,
+        keepalive_timeout=15.0,
+        use_aiodns=True,
     ):
         """Init to instantiate Solr class.
 
@@ -104,6 +182,15 @@ class Client:  # pylint: disable=too-many-instance-attributes
         timeout, ttl_dns_cache, and trace_configs arguments are stored to be used when setting up
         the AIOHTTP ClientSession class.
         See: https://docs.aiohttp.org/en/stable/client_reference.html
+
+        connection_limit caps the number of simultaneous connections in the session's pool and
+        connection_limit_per_host the number to the same host (0 means no limit). Idle connections
+        are kept alive for keepalive_timeout seconds to be reused by later requests. If
+        use_aiodns is True and aiodns is installed, DNS lookups are done asynchronously with c-ares
+        instead of getaddrinfo in a thread pool.
+
+        If shared_session is True the client uses a ClientSession (and its connection pool) shared
+        with every other shared client on the same event loop, see get_shared_session.
         """
         if connection_url is None:
             self.base_url = f"{scheme}://{host}:{port}/solr"
@@ -114,7 +201,6 @@ class Client:  # pylint: disable=too-many-instance-attributes
             self.base_url = f"{url.scheme}://{url.netloc}{base_path}"
             self.collection = collection or None
 
-        self.response_writer = "json"
         # In some cases you may want to set the
         # connection timeout to 4 b/c of the TCP packet retransmission window
         # http://docs.python-requests.org/en/master/user/advanced/#timeouts
@@ -122,77 +208,101 @@ class Client:  # pylint: disable=too-many-instance-attributes
         self.client_timeout = client_timeout
 
         self.session = None
+        self.shared_session = shared_session
         self.trace_configs = trace_configs
         self.ttl_dns_cache = ttl_dns_cache
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.use_aiodns = use_aiodns
 
         self.read_timeout = read_timeout
         self.write_timeout = write_timeout
 
+        # "{base_url}/{collection}/{handler}?wt={response_writer}" url prefixes, see _url
+        self._url_cache: dict[tuple[str, str], str] = {}
+
         if debug:
             LOGGER.setLevel(logging.DEBUG)
             logging.getLogger("aiohttp.client").setLevel(logging.DEBUG)
 
+    async def __aenter__(self):
+        """Use the client as an async context manager, the session is still set up lazily."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        """Close the client when leaving the async with block."""
+        await self.close()
+
     def _deserialize(self, resp):
         """Deserialize Solr response to Python object."""
         # TODO Handle types other than json
-        if self.response_writer == "json":
-            data = json.loads(resp.body)
+        if not resp.body:
+            # e.g. a 204 No Content
+            data = {}
+        elif self.response_writer == "json":
+            data = _json_loads(resp.body)
         else:
             data = resp.body
         return Response(data, resp.status)
 
-    # TODO Make headers something other than a dictionary
-    # pylint: disable=dangerous-default-value
-    async def _get(self, url, *, body={}, headers={}):
+    async def _get(self, url, *, body=None, headers=None):
         """Network request to get data from a server."""
-        if "Accept" not in headers and self.response_writer == "json":
-            headers["Accept"] = "application/json"
+        if headers is None and self.response_writer == "json":
+            # Shared constants, aiohttp copies the headers it is given rather than mutating them
+            headers = _JSON_BODY_HEADERS if body else _JSON_HEADERS
+        else:
+            headers = dict(headers or {})
+            if "Accept" not in headers and self.response_writer == "json":
+                headers["Accept"] = "application/json"
+            if body:
+                headers["Content-Type"] = "application/json"
 
-        if not self.session:
-            await self.setup()
-            if TYPE_CHECKING:
-                assert self.session
+        session = await self._get_session()
 
         LOGGER.debug(url)
         LOGGER.debug(headers)
         if body:
             LOGGER.debug(body)
-            headers["Content-Type"] = "application/json"
-            async with self.session.post(url, headers=headers, json=body) as response:
-                response.body = await response.text()
+            # Encode the body ourselves so orjson is used instead of aiohttp's json.dumps
+            async with session.post(url, headers=headers, data=_json_dumps(body)) as response:
+                response.body = await response.read()
         else:
-            async with self.session.get(url, headers=headers) as response:
-                response.body = await response.text()
+            async with session.get(url, headers=headers) as response:
+                response.body = await response.read()
 
         return response
 
-    # TODO Make headers something other than a dictionary
-    # pylint: disable=dangerous-default-value
-    async def _get_check_ok_deserialize(self, url, *, body={}, headers={}):
-        """Get url, check status 200 and return deserialized data."""
+    async def _get_check_ok(self, url, *, body=None, headers=None):
+        """Get url, check for a 2xx status and return the response without deserializing it."""
         response = await self._get(url, body=body, headers=headers)
 
-        if response.status != 200:
-            msg, trace = None, None
-            try:
-                error = self._deserialize(response)
-                msg = error.data.get("error", {}).get("msg", error)
-                trace = error.data.get("error", {}).get("trace")
-            except BaseException:  # pylint: disable=broad-except
-                # TODO Figure out all the possible exceptions and catch them instead of BaseExcept
-                msg = str(response.body)
-
-            raise SolrError(msg, trace)
+        self._raise_for_status(response)
+        return response
 
+    async def _get_check_ok_deserialize(self, url, *, body=None, headers=None):
+        """Get url, check for a 2xx status and return deserialized data."""
+        response = await self._get_check_ok(url, body=body, headers=headers)
         return self._deserialize(response)
 
     def _get_collection(self, kwargs):
         """Get the collection name from the kwargs or instance variable."""
-        if "collection" in kwargs:
-            return kwargs.pop("collection")
-        if self.collection:
-            return self.collection
-        raise SolrError("Collection name not provided.")
+        collection = kwargs.pop("collection", None) or self.collection
+        if not collection:
+            raise SolrError("Collection name not provided.")
+        return collection
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the open ClientSession, setting one up on first use or after it was closed.
+
+        setup never yields to the event loop, so concurrent first requests can't race each other
+        into creating two sessions.
+        """
+        if self.session is None or self.session.closed:
+            await self.setup()
+            if TYPE_CHECKING:
+                assert self.session
+        return self.session
 
     @staticmethod
     def _kwargs_to_json_body(kwargs):
@@ -203,86 +313,165 @@ class Client:  # pylint: disable=too-many-instance-attributes
     def _kwargs_to_query_string(kwargs):
         """Convert kwarg arguments to Solr query string."""
         # TODO Think about if I should validate any query params in kwargs?
-        query_string = ""
+        params = []
 
-        # fq param accepted multiple times in URL query string
+        # Some params are accepted multiple times in URL query string
         # https://lucene.apache.org/solr/guide/8_6/common-query-parameters.html
-        if "fq" in kwargs and isinstance(kwargs.get("fq"), list):
-            fqs = kwargs.pop("fq")
-            for _fq in fqs:
-                _fq = urllib.parse.quote_plus(str(_fq), encoding="utf8")
-                query_string += f"&fq={_fq}"
-
-        # facet.field param accepted multiple times in URL query string
-        if "facet.field" in kwargs and isinstance(kwargs.get("facet.field"), list):
-            ffields = kwargs.pop("facet.field")
-            for _ff in ffields:
-                _ff = urllib.parse.quote_plus(str(_ff), encoding="utf8")
-                query_string += f"&facet.field={_ff}"
-
-        # boost param accepted multiple times in URL query string
-        if "boost" in kwargs and isinstance(kwargs.get("boost"), list):
-            boost_fields = kwargs.pop("boost")
-            for _bf in boost_fields:
-                _bf = urllib.parse.quote_plus(str(_bf), encoding="utf8")
-                query_string += f"&boost={_bf}"
+        for param in _MULTI_VALUED_PARAMS:
+            if param in kwargs and isinstance(kwargs.get(param), (list, tuple)):
+                params.append((param, kwargs.pop(param)))
 
         for param, value in kwargs.items():
-            if isinstance(value, list):
-                separator = (
-                    "+"
-                    if param
-                    in (
-                        "pf",
-                        "pf2",
-                        "pf3",
-                        "qf",
-                    )
-                    else ","
-                )
-                clean_vals = [urllib.parse.quote_plus(str(i), encoding="utf8") for i in value]
-                # pylint: disable=consider-using-f-string
-                query_string += "&{}={}".format(param, separator.join(clean_vals))
+            if isinstance(value, (list, tuple)):
+                separator = " " if param in _SPACE_SEPARATED_PARAMS else ","
+                params.append((param, separator.join(str(i) for i in value)))
             elif isinstance(value, bool):
                 # using title cased bools results in the following error in Solr logs
                 # org.apache.solr.common.SolrException: invalid boolean value: False
-                query_string += f"&{param}=true" if value else f"&{param}=false"
+                params.append((param, "true" if value else "false"))
             else:
-                clean_val = urllib.parse.quote_plus(str(value), encoding="utf8")
-                query_string += f"&{param}={clean_val}"
+                # str() so urlencode's doseq only ever expands the multi valued params above
+                params.append((param, str(value)))
+
+        if not params:
+            return ""
 
-        return query_string
+        # urlencode quotes every value and expands the multi valued lists in a single call
+        return "&" + urllib.parse.urlencode(params, doseq=True, quote_via=urllib.parse.quote_plus)
+
+    async def _run_many(self, make_coro, items, concurrency, return_exceptions):
+        """Await make_coro(item) for each item, at most concurrency at once, and return in order.
+
+        Each coroutine is only created once it may run, so none are left unawaited if setting up
+        the session fails.
+        """
+        if concurrency < 1:
+            raise SolrError("concurrency must be at least 1.")
+
+        await self._get_session()
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(item):
+            async with semaphore:
+                return await make_coro(item)
+
+        return await asyncio.gather(
+            *(run(item) for item in items), return_exceptions=return_exceptions
+        )
 
     async def _post(self, url, data, headers=None):
         """Network request to post data to a server."""
-        if not self.session:
-            await self.setup()
-            if TYPE_CHECKING:
-                assert self.session
+        session = await self._get_session()
 
         if isinstance(data, (dict, list)):
-            if headers:
-                headers["Content-Type"] = "application/json"
-            else:
-                headers = {"Content-Type": "application/json"}
+            content_type = "application/json"
+            data = _json_dumps(data)
+        else:
+            content_type = "text/xml"
+        # Copy so the caller's headers aren't mutated
+        headers = {**(headers or {}), "Content-Type": content_type}
+
+        LOGGER.debug(url)
+        async with session.post(url, data=data, headers=headers) as response:
+            response.body = await response.read()
 
-            LOGGER.debug(url)
-            async with self.session.post(url, headers=headers, json=data) as response:
-                response.body = await response.text()
+        return response
 
-        else:
-            if headers:
-                headers["Content-Type"] = "text/xml"
+    async def _post_check_ok_deserialize(self, url, data, headers=None):
+        """Post data to url, check for a 2xx status and return deserialized data."""
+        response = await self._post(url, data, headers=headers)
+        self._raise_for_status(response)
+        return self._deserialize(response)
+
+    def _query_url_and_body(self, collection, handler, kwargs):
+        """Apply the kwarg conventions of query and build its url and JSON Request API body.
+
+        The body is None for handlers which only take params in the url query string.
+        """
+        if handler in ("select", "mlt", "query") and "q" not in kwargs:
+            kwargs["q"] = kwargs.pop("query", "*")
+
+        url = self._url(collection, handler)
+
+        if kwargs.get("spellcheck"):
+            # Docs state the default SpellingQueryConverter class only handles ASCII so we
+            # need to specify spellcheck.q for Unicode support
+            # https://lucene.apache.org/solr/guide/8_6/spell-checking.html
+            kwargs["spellcheck.q"] = kwargs["q"]
+            if "spellcheck_dicts" in kwargs and "spellcheck.dictionary" not in kwargs:
+                kwargs["spellcheck.dictionary"] = kwargs.pop("spellcheck_dicts", [])
+
+        if "prefer_local" in kwargs:
+            kwargs.pop("prefer_local")
+            url += "&shards.preference=replica.location:local"
+
+        if handler == "select":
+            return url, self._kwargs_to_json_body(kwargs)
+        # mlt handler and some others don't support params in body
+        return url + self._kwargs_to_query_string(kwargs), None
+
+    @staticmethod
+    def _raise_for_status(response):
+        """Raise a SolrError with Solr's error message and trace unless the response is a 2xx."""
+        if 200 <= response.status < 300:
+            return
+
+        try:
+            # Only the error details are needed so skip building a full Response
+            error = _json_loads(response.body).get("error", {})
+            msg = error.get("msg") or response.body.decode("utf-8", "replace")
+            trace = error.get("trace")
+        except (AttributeError, ValueError):
+            # Body is not JSON (ValueError) or not a JSON object (AttributeError)
+            msg, trace = response.body.decode("utf-8", "replace"), None
+
+        raise SolrError(msg, trace=trace)
+
+    @staticmethod
+    def _remove_chars(query: str, allow_http: bool, allow_wildcard: bool, remove_chars: str) -> str:
+        """Remove urls, unwanted chars and wildcards from a query as configured in clean."""
+        if not allow_http:
+            query = _HTTP_RE.sub("", query)
+
+        # Remove these chars
+        if remove_chars == _REMOVE_CHARS:
+            # Deleting the default chars (and wildcards) with a translate table is a single pass
+            if allow_wildcard:
+                query = query.translate(_REMOVE_CHARS_TABLE)
             else:
-                headers = {"Content-Type": "text/xml"}
+                query = query.translate(_REMOVE_CHARS_WILDCARD_TABLE)
+        else:
+            query = re.sub(remove_chars, "", query)
+            if not allow_wildcard:
+                query = query.replace("*", "")
 
-            async with self.session.post(url, data=data, headers=headers) as response:
-                response.body = await response.text()
+        if not allow_wildcard:
+            # Also remove urlencoded wildcard (*)
+            query = query.replace("%2a", "")
 
-        return response
+        return query
 
     @staticmethod
-    def _truncate_utf8(query, length, preserve_words=True):
+    def _strip_html(query: str) -> str:
+        """Strip html tags and escape what is left like bleach.clean(query, strip=True).
+
+        Unlike bleach no tags are allowed, and no html parser is set up so it is far cheaper for
+        the short strings typical of search queries. Control chars other than tab and newline are
+        removed where bleach would replace them with "?".
+        """
+        if _HTML_SPECIAL_CHARS.isdisjoint(query):
+            # Most queries have nothing to strip or escape
+            return query
+        query = query.replace("\r\n", "\n").translate(_CONTROL_CHARS_TABLE)
+        query = _HTML_TAG_RE.sub("", query)
+        query = _BARE_AMPERSAND_RE.sub("&amp;", query)
+        return query.replace("<", "&lt;").replace(">", "&gt;")
+
+    @staticmethod
+    def _truncate_utf8(
+        query: typing.Union[str, bytes], length: int, preserve_words: bool = True
+    ) -> str:
         """Truncate utf8 strings.
 
         If applicable, remove isolated high surrogate code points at the end of
@@ -297,26 +486,63 @@ class Client:  # pylint: disable=too-many-instance-attributes
         original_len = len(query)
         # Truncate if necessary
         query = query[:length]
-        query = re.sub("[\ud800-\udbff]$", "", query)
-        # Now if we did truncate, and if we want to, preserve words
-        if original_len > len(query) and preserve_words:
+        # A single char comparison is much cheaper than a regex for the trailing surrogate
+        if query and "\ud800" <= query[-1] <= "\udbff":
+            query = query[:-1]
+        if original_len == len(query):
+            # Nothing was truncated and query is already stripped
+            return query
+        # Now since we did truncate, if we want to, preserve words
+        if preserve_words:
             query = query.rsplit(" ", 1)[0]
-        # Strip a final time in case truncating left whitespace on the end
-        return query.strip()
+        # Truncating can only leave whitespace on the end, the start was already stripped
+        return query.rstrip()
+
+    def _url(self, collection, handler):
+        """Get the url of a collection's handler including the response writer param.
 
-    async def check_dataimport_status(
-        self, handler="dataimport", max_retries=5, sleep_interval=60, **kwargs
+        The url is built once per (collection, handler) pair and cached as it is needed on every
+        request but rarely changes.
+        """
+        key = (collection, handler)
+        url = self._url_cache.get(key)
+        if url is None:
+            url = f"{self.base_url}/{collection}/{handler}?wt={self.response_writer}"
+            self._url_cache[key] = url
+        return url
+
+    async def check_dataimport_status(  # pylint: disable=too-many-locals
+        self,
+        handler="dataimport",
+        max_retries=5,
+        sleep_interval=60,
+        jitter=0.0,
+        backoff_base: typing.Optional[float] = None,
+        **kwargs,
     ):
-        """Loop and check dataimport status until it is successful."""
+        """Loop and check dataimport status until it is successful.
+
+        By default the status is checked every sleep_interval seconds. If backoff_base is given the
+        sleeps grow exponentially instead (backoff_base, 2 * backoff_base, 4 * backoff_base...) up
+        to sleep_interval, so a quick import is noticed quickly while a long one is not polled
+        more than necessary. jitter randomly varies each sleep by up to that fraction so clients
+        polling at the same time spread their requests out.
+        """
+        if not 0 <= jitter <= 1:
+            raise SolrError("jitter must be between 0 and 1.")
+        if backoff_base is not None and backoff_base <= 0:
+            raise SolrError("backoff_base must be positive.")
+
         LOGGER.debug("Checking status of indexing...")
 
         status = False
         response_body = None
         retries = 0
+        slept = 0.0
 
         collection = self._get_collection(kwargs)
-        url = f"{self.base_url}/{collection}/{handler}?command=status&wt={self.response_writer}"
-        while status is False and retries < max_retries:
+        url = f"{self._url(collection, handler)}&command=status"
+        while retries < max_retries:
             try:
                 solr_response = await self._get(url)
                 response_body = self._deserialize(solr_response)
@@ -324,98 +550,178 @@ class Client:  # pylint: disable=too-many-instance-attributes
                     LOGGER.debug("Indexing completed!")
                     status = response_body.data["statusMessages"]
                     break
-            except BaseException:  # pylint: disable=broad-except
-                # TODO Figure out all the possible exceptions and catch them instead of BaseExcept
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                KeyError,
+                TypeError,
+                ValueError,
+            ):
+                # Solr could not be reached or did not send a parseable status yet
                 LOGGER.debug("Status not ready yet, sleeping...")
 
+            if backoff_base is None:
+                delay = sleep_interval
+            else:
+                delay = min(sleep_interval, backoff_base * 2**retries)
+            delay *= random.uniform(1 - jitter, 1 + jitter)
             retries += 1
-            await asyncio.sleep(sleep_interval)
-
-        if (
-            response_body
-            and response_body.status == 200
-            and status is not False
-            and retries < max_retries
-        ):
+            slept += delay
+            await asyncio.sleep(delay)
+
+        if response_body and response_body.status == 200 and status is not False:
             LOGGER.debug(status)
         else:
             msg = (
-                "Unable to verify dataimport success on %s after %s seconds and %s retries and "
-                "status message %s!",
-                collection,
-                sleep_interval * retries,
-                retries,
-                status,
+                f"Unable to verify dataimport success on {collection} after {slept:.0f} seconds "
+                f"and {retries} retries and status message {status}!"
             )
             # LOGGER.error(msg)
             raise SolrError(msg)
 
-    @staticmethod
-    def clean(
-        query,  # end user query
-        allow_html_tags=False,
-        allow_http=False,
-        allow_wildcard=False,
-        find_and_replace: tuple[tuple[str, str]] = (
-            (":", r"\:"),
-            ("|", " "),
-        ),  # tuple of tuples (find_me, replace_with)
-        max_len=0,
-        # regex of chars to remove
-        remove_chars=r'[\"\&\!\(\)\{\}\[\]\^"~\?\\;#,]',
-        urlencode=False,
-    ):
-        """Typical query cleaning."""
-        if not allow_http:
-            query = re.sub(r"http\S+", "", query)
+    async def check_dataimport_status_many(self, collections, handler="dataimport", **kwargs):
+        """Check the dataimport status of several collections concurrently.
 
-        # Remove these chars
-        query = re.sub(remove_chars, "", query)
+        Accepts the same arguments as check_dataimport_status, except a collection kwarg is
+        ignored in favour of collections. Once every collection is checked the first error, a
+        SolrError unless something unexpected went wrong, is raised. A check which was cancelled
+        or interrupted is re-raised ahead of any error.
+        """
+        kwargs.pop("collection", None)
+        results = await asyncio.gather(
+            *(
+                self.check_dataimport_status(handler, collection=collection, **kwargs)
+                for collection in collections
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            # e.g. CancelledError or KeyboardInterrupt, which must not be hidden behind an error
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
-        if not allow_wildcard:
-            query = query.replace("*", "")
-            # Also remove urlencoded wildcard (*)
-            query = query.replace("%2a", "")
+    @staticmethod
+    def clean(  # pylint: disable=too-many-locals
+        query: typing.Union[str, bytes, bytearray],  # end user query
+        allow_html_tags: bool = False,
+        allow_http: bool = False,
+        allow_wildcard: bool = False,
+        # tuple of tuples (find_me, replace_with)
+        find_and_replace: tuple[tuple[str, str], ...] = _FIND_AND_REPLACE,
+        max_len: int = 0,
+        # regex of chars to remove
+        remove_chars: str = _REMOVE_CHARS,
+        urlencode: bool = False,
+        strict_html: bool = False,
+    ) -> str:
+        """Typical query cleaning.
 
-        if find_and_replace:
-            for find, replace in find_and_replace:
-                query = query.replace(find, replace)
+        Unless allow_html_tags is set, html tags are stripped from the query. By default that is
+        done with a lightweight regex, pass strict_html to run it through bleach instead.
 
-        if not allow_html_tags:
-            # bleach it to prevent JS injection or other unwanted html
-            # when displaying the query back to the user in a web page
-            query = bleach.clean(query, strip=True)
+        A bytes query, e.g. read straight from a request body, is decoded as utf8 once up front.
+        """
+        text: str = query.decode("utf-8") if isinstance(query, (bytes, bytearray)) else query
+
+        # Most queries are plain words which every step up to truncation would leave unchanged
+        plain = (
+            not allow_http
+            and not allow_wildcard
+            and remove_chars == _REMOVE_CHARS
+            and not strict_html
+            and find_and_replace == _FIND_AND_REPLACE
+            and _CLEAN_SPECIAL_CHARS.isdisjoint(text)
+            and "http" not in text
+        )
+        if not plain:
+            text = Client._remove_chars(text, allow_http, allow_wildcard, remove_chars)
+
+            if find_and_replace:
+                for find, replace in find_and_replace:
+                    text = text.replace(find, replace)
+
+            if not allow_html_tags:
+                # strip html to prevent JS injection or other unwanted html
+                # when displaying the query back to the user in a web page
+                if strict_html:
+                    # bleach pulls in html5lib, so it is an optional dependency only imported when
+                    # it is used
+                    try:
+                        import bleach  # pylint: disable=import-outside-toplevel
+                    except ImportError as err:
+                        raise SolrError(
+                            "strict_html requires bleach, "
+                            "install it with: pip install aiosolr[html]"
+                        ) from err
+
+                    text = bleach.clean(text, strip=True)
+                else:
+                    text = Client._strip_html(text)
 
         if max_len:
             # Queries that are too long can cause performance issues
-            query = Client._truncate_utf8(query, max_len)
+            text = Client._truncate_utf8(text, max_len)
 
         if urlencode:
-            query = urllib.parse.quote_plus(str(query), encoding="utf8")
+            text = urllib.parse.quote_plus(text, encoding="utf8")
 
-        return query
+        return text
+
+    @staticmethod
+    def clean_many(queries: typing.Iterable[typing.Union[str, bytes, bytearray]], **kwargs) -> list:
+        """Clean a batch of queries with the same clean options, e.g. when reindexing.
+
+        Accepts the same keyword arguments as clean and returns the cleaned queries in order.
+        """
+        clean = Client.clean
+        return [clean(query, **kwargs) for query in queries]
 
     async def close(self):
-        """Close down Client Session."""
+        """Close down Client Session.
+
+        A shared session is left open for the other clients, see close_shared_session.
+        """
+        if self.shared_session:
+            self.session = None
+            return
+
         LOGGER.debug("Closing Solr session connection...")
         if self.session:
             await self.session.close()
 
-    async def commit(self, handler="update", soft=False, **kwargs):
-        """Perform a commit on the collection."""
+    @classmethod
+    async def close_shared_session(cls):
+        """Close down the Client Session shared by clients on the running event loop."""
+        session = cls._shared_sessions.pop(asyncio.get_running_loop(), None)
+        if session:
+            LOGGER.debug("Closing shared Solr session connection...")
+            await session.close()
+
+    async def commit(self, handler="update", soft=False, deserialize=True, **kwargs):
+        """Perform a commit on the collection.
+
+        Pass deserialize=False to skip parsing Solr's reply when only success matters, in which
+        case None is returned.
+        """
         collection = self._get_collection(kwargs)
         LOGGER.debug(
             "Performing commit to Solr %s collection via %s handler...", collection, handler
         )
         url = f"{self.base_url}/{collection}/{handler}?"
         url += "softCommit=true" if soft is True else "commit=true"
+        if not deserialize:
+            await self._get_check_ok(url)
+            return None
         return await self._get_check_ok_deserialize(url)
 
     async def dataimport(self, handler="dataimport", **kwargs):
         """Call a DIH (data import handler)."""
         LOGGER.debug("Calling dataimport handler /%s...", handler)
         collection = self._get_collection(kwargs)
-        url = f"{self.base_url}/{collection}/{handler}?wt={self.response_writer}"
+        url = self._url(collection, handler)
         url += self._kwargs_to_query_string(kwargs)
         solr_response = await self._get(url)
         return self._deserialize(solr_response)
@@ -426,39 +732,86 @@ class Client:  # pylint: disable=too-many-instance-attributes
         LOGGER.debug(
             "Getting document from Solr collection %s via handler %s...", collection, handler
         )
-        url = f"{self.base_url}/{collection}/{handler}?id={_id}&wt={self.response_writer}"
+        url = f"{self._url(collection, handler)}&id={_id}"
         url += self._kwargs_to_query_string(kwargs)
         return await asyncio.wait_for(
             self._get_check_ok_deserialize(url),
             read_timeout if read_timeout is not None else self.read_timeout,
         )
 
-    async def ping(self, handler="ping", action="status", **kwargs):
-        """Use Solr's ping handler to check status of, enable, or disable a node."""
+    async def get_many(self, ids, *, concurrency=20, return_exceptions=False, **kwargs):
+        """Retrieve several documents by id concurrently with Solr's built-in get handler.
+
+        kwargs are passed to get for every id. At most concurrency requests are in flight at once.
+        Responses are returned in the same order as the ids.
+        """
+        return await self._run_many(
+            lambda _id: self.get(_id, **kwargs), ids, concurrency, return_exceptions
+        )
+
+    async def ping(self, handler="ping", action="status", deserialize=True, **kwargs):
+        """Use Solr's ping handler to check status of, enable, or disable a node.
+
+        Pass deserialize=False to skip parsing Solr's reply when only success matters, in which
+        case None is returned.
+        """
         assert action.lower() in ("status", "enable", "disable")
         LOGGER.debug("Pinging Solr...")
         collection = self._get_collection(kwargs)
-        url = (
-            f"{self.base_url}/{collection}/{handler}"
-            f"?distrib=false&action={action}&wt={self.response_writer}"
-        )
+        url = f"{self._url(collection, handler)}&distrib=false&action={action}"
+        if not deserialize:
+            await self._get_check_ok(url)
+            return None
         return await self._get_check_ok_deserialize(url)
 
-    async def setup(self):
-        """Setup the ClientSession for use."""
+    def _create_session(self):
+        """Create a ClientSession using this client's connection settings."""
         LOGGER.debug("Creating Solr session connection...")
-        tcp_conn = aiohttp.TCPConnector(ttl_dns_cache=self.ttl_dns_cache)
-        self.session = aiohttp.ClientSession(
+        resolver = aiohttp.AsyncResolver() if self.use_aiodns and aiodns else None
+        tcp_conn = aiohttp.TCPConnector(
+            keepalive_timeout=self.keepalive_timeout,
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            resolver=resolver,
+            ttl_dns_cache=self.ttl_dns_cache,
+        )
+        return aiohttp.ClientSession(
             connector=tcp_conn,
             timeout=self.client_timeout,
             trace_configs=self.trace_configs,
         )
 
-    async def suggestions(self, handler, query=None, build=False, **kwargs):
+    def get_shared_session(self):
+        """Get the ClientSession shared by all clients on the running event loop.
+
+        The shared session is created with the settings of the first client to request it and
+        reused as is afterwards, so keepalive connections stay warm across clients.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._shared_sessions.get(loop)
+        if session is None or session.closed:
+            # Forget sessions of loops that have since closed, e.g. with an asyncio.run per job,
+            # so they and their connectors aren't kept alive forever. They can't be closed anymore.
+            for closed_loop in [other for other in self._shared_sessions if other.is_closed()]:
+                del self._shared_sessions[closed_loop]
+            session = self._create_session()
+            self._shared_sessions[loop] = session
+        return session
+
+    async def setup(self):
+        """Setup the ClientSession for use."""
+        if self.shared_session:
+            self.session = self.get_shared_session()
+        else:
+            self.session = self._create_session()
+
+    async def suggestions(self, handler, query=None, build=False, columnar=False, **kwargs):
         """
         Query a RequestHandler of class SearchHandler using the SuggestComponent.
 
-        Returns a tuple of response object and useful data or None if failure.
+        Returns a tuple of response object and useful data or None if failure. The suggestions are
+        a list of {"match": ..., "payload": ...} dicts, or with columnar=True a single
+        {"match": [...], "payload": [...]} dict of parallel lists which saves a dict per suggestion.
         """
         if not query and not build:
             return SolrError("query or build required for suggestions.")
@@ -466,25 +819,33 @@ class Client:  # pylint: disable=too-many-instance-attributes
         collection = self._get_collection(kwargs)
         LOGGER.debug("Querying Solr collection %s suggestions handler /%s...", collection, handler)
 
-        url = f"{self.base_url}/{collection}/{handler}?wt={self.response_writer}"
+        url = self._url(collection, handler)
         if query:
             url += f"&suggest.q={query}"
         if build:
             url += "&suggest.build=true"
 
         response = await self._get_check_ok_deserialize(url)
-        suggestions = []
+        suggestions = {"match": [], "payload": []} if columnar else []
 
         if query:
             if "+" in query:
                 query = query.replace("+", " ")
 
-            for name in response.data["suggest"].keys():
+            for suggester in response.data["suggest"].values():
                 try:
-                    suggestions += [
-                        {"match": s["term"], "payload": s["payload"]}
-                        for s in response.data["suggest"][name][query]["suggestions"]
-                    ]
+                    # Built in full before extending so a malformed suggester adds nothing
+                    if columnar:
+                        found = suggester[query]["suggestions"]
+                        matches = [s["term"] for s in found]
+                        payloads = [s["payload"] for s in found]
+                        suggestions["match"] += matches
+                        suggestions["payload"] += payloads
+                    else:
+                        suggestions += [
+                            {"match": s["term"], "payload": s["payload"]}
+                            for s in suggester[query]["suggestions"]
+                        ]
                 except KeyError:
                     pass
 
@@ -495,55 +856,73 @@ class Client:  # pylint: disable=too-many-instance-attributes
         LOGGER.debug("Querying Solr %s handler...", handler)
         collection = self._get_collection(kwargs)
 
-        if handler in ("select", "mlt", "query") and "q" not in kwargs:
-            if "query" not in kwargs:
-                kwargs["q"] = "*"
-            else:
-                kwargs["q"] = kwargs.pop("query")
+        if self.response_writer != "json":
+            raise SolrError("Non json responses not yet supported.")
 
-        if self.response_writer == "json":
-            url = f"{self.base_url}/{collection}/{handler}?wt={self.response_writer}"
+        url, body = self._query_url_and_body(collection, handler, kwargs)
+        return await asyncio.wait_for(
+            self._get_check_ok_deserialize(url, body=body),
+            read_timeout if read_timeout is not None else self.read_timeout,
+        )
 
-            if kwargs.get("spellcheck"):
-                # Docs state the default SpellingQueryConverter class only handles ASCII so we
-                # need to specify spellcheck.q for Unicode support
-                # https://lucene.apache.org/solr/guide/8_6/spell-checking.html
-                kwargs["spellcheck.q"] = kwargs["q"]
-                if "spellcheck_dicts" in kwargs and "spellcheck.dictionary" not in kwargs:
-                    kwargs["spellcheck.dictionary"] = kwargs.pop("spellcheck_dicts", [])
-
-            if "prefer_local" in kwargs:
-                kwargs.pop("prefer_local")
-                url += "&shards.preference=replica.location:local"
-
-            if handler == "select":
-                body = self._kwargs_to_json_body(kwargs)
-                solr_response = await asyncio.wait_for(
-                    self._get(url, body=body),
-                    read_timeout if read_timeout is not None else self.read_timeout,
-                )
-            else:  # mlt handler and some others don't support params in body
-                url += self._kwargs_to_query_string(kwargs)
-                solr_response = await asyncio.wait_for(
-                    self._get(url),
-                    read_timeout if read_timeout is not None else self.read_timeout,
-                )
-
-            if solr_response.status != 200:
-                msg, trace = None, None
-                try:
-                    error = self._deserialize(solr_response)
-                    msg = error.data.get("error", {}).get("msg", error)
-                    trace = error.data.get("error", {}).get("trace")
-                except BaseException:  # pylint: disable=broad-except
-                    # TODO Figure out all the possible exceptions and catch them instead of Base
-                    msg = str(solr_response.body)
-
-                raise SolrError(msg, trace)
+    async def query_many(self, queries, *, concurrency=20, return_exceptions=False):
+        """Run several queries concurrently over the session's connection pool.
+
+        Each item of queries is a dict of the kwargs accepted by query. At most concurrency
+        queries are in flight at once. Responses are returned in the same order as the queries.
+        """
+        return await self._run_many(
+            lambda kwargs: self.query(**kwargs), queries, concurrency, return_exceptions
+        )
+
+    async def query_stream(
+        self, *, handler="select", read_timeout: typing.Optional[int] = None, **kwargs
+    ):
+        """Query a requestHandler of class SearchHandler and yield its documents one at a time.
+
+        The response is parsed incrementally as it is received, so the whole result set is never
+        held in memory. Only the documents are available, not spellcheck, MLT or other sections of
+        the response. Requires ijson to be installed.
+
+        Accepts the same arguments as query, except read_timeout limits how long to wait for each
+        chunk of the response rather than for the whole of it.
+        """
+        if ijson is None:
+            raise SolrError("ijson is required to stream query results.")
+
+        LOGGER.debug("Streaming Solr %s handler...", handler)
+        collection = self._get_collection(kwargs)
+        url, body = self._query_url_and_body(collection, handler, kwargs)
+
+        session = await self._get_session()
+        timeout = read_timeout if read_timeout is not None else self.read_timeout
+        if timeout is None:
+            stream_timeout = self.client_timeout
         else:
-            raise SolrError("Non json responses not yet supported.")
+            stream_timeout = aiohttp.ClientTimeout(
+                total=self.client_timeout.total,
+                connect=self.client_timeout.connect,
+                sock_connect=self.client_timeout.sock_connect,
+                sock_read=timeout,
+            )
 
-        return self._deserialize(solr_response)
+        if body is None:
+            request = session.get(url, headers=_JSON_HEADERS, timeout=stream_timeout)
+        else:
+            request = session.post(
+                url, headers=_JSON_BODY_HEADERS, data=_json_dumps(body), timeout=stream_timeout
+            )
+
+        async with request as response:
+            if not 200 <= response.status < 300:
+                # Stash the body on the response for _raise_for_status as _get does
+                response.body = await response.read()  # type: ignore[attr-defined]
+                self._raise_for_status(response)
+
+            async for doc in ijson.items_async(
+                response.content, "response.docs.item", use_float=True
+            ):
+                yield doc
 
     async def update(
         self,
@@ -556,30 +935,26 @@ class Client:  # pylint: disable=too-many-instance-attributes
         """Update a document using Solr's update handler."""
         collection = self._get_collection(kwargs)
         LOGGER.debug("Updating %s data in Solr via %s handler...", collection, handler)
-        url = f"{self.base_url}/{collection}/{handler}?wt={self.response_writer}"
+        url = self._url(collection, handler)
         if overwrite:
             url += "&overwrite=true"
         url += self._kwargs_to_query_string(kwargs)
 
-        response = await asyncio.wait_for(
-            self._post(url, data),
+        return await asyncio.wait_for(
+            self._post_check_ok_deserialize(url, data),
             write_timeout if write_timeout is not None else self.write_timeout,
         )
-        if response.status == 200:
-            data = self._deserialize(response)
-        else:
-            msg, trace = None, None
-            try:
-                error = self._deserialize(response)
-                msg = error.data.get("error", {}).get("msg", error)
-                trace = error.data.get("error", {}).get("trace")
-            except BaseException:  # pylint: disable=broad-except
-                # TODO Figure out all the possible exceptions and catch them instead of BaseExcept
-                msg = str(response.body)
 
-            raise SolrError(msg, trace)
+    async def update_many(self, batches, *, concurrency=20, return_exceptions=False, **kwargs):
+        """Send several updates concurrently with Solr's update handler.
 
-        return data
+        Each item of batches is the data for one update call, kwargs are passed to update for every
+        batch. At most concurrency requests are in flight at once. Responses are returned in the
+        same order as the batches.
+        """
+        return await self._run_many(
+            lambda data: self.update(data, **kwargs), batches, concurrency, return_exceptions
+        )
 
 
 # Convenience shortcut to clean method
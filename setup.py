@@ -28,7 +28,12 @@ setup(
         "Programming Language :: Python :: 3",
     ],
     download_url=f"https://github.com/bbelyeu/aiosolr/archive/{aiosolr.__version__}.zip",
-    install_requires=["aiohttp", "bleach"],
+    install_requires=["aiohttp"],
+    extras_require={
+        "html": ["bleach"],
+        "speedups": ["aiodns", "orjson", "uvloop; sys_platform != 'win32'"],
+        "stream": ["ijson"],
+    },
     keywords=["solr", "asyncio", "aiohttp", "search"],
     license="MIT",
     long_description=open("README.md", encoding="utf8", mode="r").read(),
@@ -0,0 +1,54 @@
+"""Shared fixtures for the tests."""
+
+import types
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import aiosolr
+
+
+class FakeSolr:
+    """A local aiohttp server standing in for Solr which records the requests it gets.
+
+    Every request is answered by responder, which tests can replace. By default it returns an
+    empty json query response.
+    """
+
+    def __init__(self):
+        self.client = None
+        self.requests = []
+        self.responder = self.empty_response
+
+    @staticmethod
+    async def empty_response(request):  # pylint: disable=unused-argument
+        """Answer with an empty query response."""
+        return web.json_response({"response": {"numFound": 0, "docs": []}})
+
+    async def handle(self, request):
+        """Record the request and answer it with responder."""
+        self.requests.append(
+            types.SimpleNamespace(
+                body=await request.read(),
+                headers=request.headers,
+                method=request.method,
+                path=request.path,
+                query=request.query,
+            )
+        )
+        return await self.responder(request)
+
+
+@pytest.fixture
+async def solr():
+    """Start a FakeSolr server with a Client for its "books" collection."""
+    fake = FakeSolr()
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", fake.handle)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    fake.client = aiosolr.Client(host=server.host, port=server.port, collection="books")
+    yield fake
+    await fake.client.close()
+    await server.close()
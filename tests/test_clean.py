@@ -18,3 +18,66 @@ def test_find_and_replace(params):
     """Test query cleaning function find and replace functionality."""
     query, expected = params
     assert aiosolr.clean_query(query) == expected
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ("(hello) [world]!", {}, "hello world"),
+        ("wild* card%2a", {}, "wild card"),
+        ("wild* card%2a", {"allow_wildcard": True}, "wild* card%2a"),
+        ("a;b#c,d", {"remove_chars": r"[;]"}, "ab#c,d"),
+        ("see http://example.com now", {}, "see  now"),
+        ("see http://example.com now", {"allow_http": True}, r"see http\://example.com now"),
+        (" plain words ", {}, " plain words "),
+        (b"(hello) [world]!", {}, "hello world"),
+        (bytearray("caf\u00e9 au lait", "utf-8"), {}, "caf\u00e9 au lait"),
+        ("plain words", {"find_and_replace": (("words", "terms"),)}, "plain terms"),
+    ],
+)
+def test_remove_chars(params):
+    """Test query cleaning function removal of unwanted chars."""
+    query, kwargs, expected = params
+    assert aiosolr.clean_query(query, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ("<script>alert(1)</script>", {}, "alert1"),
+        ("<b>bold</b> move", {}, "bold move"),
+        ("1 < 2", {}, "1 &lt; 2"),
+        ("<b>bold</b> move", {"strict_html": True}, "<b>bold</b> move"),
+        ("<b>bold</b> move", {"allow_html_tags": True}, "<b>bold</b> move"),
+        ("null\x00 bell\x07 feed\x0c", {}, "null bell feed"),
+        ("tab\tline\r\nreturn\rend", {}, "tab\tline\nreturn\nend"),
+        ("null\x00", {"allow_html_tags": True}, "null\x00"),
+    ],
+)
+def test_strip_html(params):
+    """Test query cleaning function html stripping."""
+    query, kwargs, expected = params
+    assert aiosolr.clean_query(query, **kwargs) == expected
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ("  short  ", 10, "short"),
+        ("the quick brown fox", 12, "the quick"),
+        ("the quick brown fox", 19, "the quick brown fox"),
+        ("emoji 😀 more", 8, "emoji 😀"),
+        (b"the quick brown fox", 12, "the quick"),
+    ],
+)
+def test_truncate_utf8(params):
+    """Test truncating queries to a max length."""
+    query, length, expected = params
+    assert aiosolr.Client._truncate_utf8(query, length) == expected
+
+
+def test_clean_many():
+    """Test a batch of queries is cleaned in order with shared options."""
+    queries = ["large:intestines", b"(hello) [world]!", "wild* card"]
+    expected = [r"large\:intestines", "hello world", "wild* card"]
+    assert aiosolr.Client.clean_many(queries, allow_wildcard=True) == expected
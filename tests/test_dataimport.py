@@ -0,0 +1,107 @@
+"""Tests for checking the status of Solr's dataimport handler."""
+
+import asyncio
+import types
+
+import pytest
+
+import aiosolr
+
+BUSY = types.SimpleNamespace(status=200, body=b'{"status": "busy"}')
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the delays check_dataimport_status sleeps for instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(aiosolr.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def busy(monkeypatch):
+    """Make every dataimport status request report a busy import."""
+
+    async def fake_get(self, url):  # pylint: disable=unused-argument
+        return BUSY
+
+    monkeypatch.setattr(aiosolr.Client, "_get", fake_get)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ({}, [60, 60, 60]),
+        ({"sleep_interval": 10, "backoff_base": 2}, [2, 4, 8, 10, 10]),
+        ({"sleep_interval": 5, "backoff_base": 1}, [1, 2, 4, 5, 5]),
+    ],
+)
+@pytest.mark.usefixtures("busy")
+async def test_backoff(params, sleeps):  # pylint: disable=redefined-outer-name
+    """Test the delays grow from backoff_base and are capped at sleep_interval."""
+    kwargs, expected = params
+    client = aiosolr.Client(collection="books")
+    with pytest.raises(aiosolr.SolrError):
+        await client.check_dataimport_status(max_retries=len(expected), **kwargs)
+    assert sleeps == expected
+
+
+@pytest.mark.usefixtures("busy")
+async def test_jitter(sleeps):  # pylint: disable=redefined-outer-name
+    """Test jitter varies each delay by at most that fraction."""
+    client = aiosolr.Client(collection="books")
+    with pytest.raises(aiosolr.SolrError):
+        await client.check_dataimport_status(max_retries=50, sleep_interval=10, jitter=0.2)
+    assert all(8 <= delay <= 12 for delay in sleeps)
+    assert len(set(sleeps)) > 1
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"jitter": -0.1}, {"jitter": 1.5}, {"backoff_base": 0}, {"backoff_base": -1}]
+)
+async def test_invalid_backoff(kwargs):
+    """Test out of range jitter and backoff_base are rejected."""
+    client = aiosolr.Client(collection="books")
+    with pytest.raises(aiosolr.SolrError):
+        await client.check_dataimport_status(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ({"books": "idle", "authors": "idle"}, None),
+        ({"books": "idle", "authors": "busy", "titles": "error"}, aiosolr.SolrError),
+        ({"books": "error", "authors": "cancel"}, asyncio.CancelledError),
+    ],
+)
+@pytest.mark.usefixtures("sleeps")
+async def test_check_many(params, monkeypatch):
+    """Test every collection is checked and errors are raised, cancellation first."""
+    statuses, error = params
+    checked = []
+
+    async def fake_get(self, url):  # pylint: disable=unused-argument
+        collection = url.split("/")[-2]
+        checked.append(collection)
+        status = statuses[collection]
+        if status == "cancel":
+            raise asyncio.CancelledError()
+        if status == "error":
+            raise aiosolr.SolrError("unexpected")
+        return types.SimpleNamespace(
+            status=200, body=f'{{"status": "{status}", "statusMessages": {{}}}}'.encode()
+        )
+
+    monkeypatch.setattr(aiosolr.Client, "_get", fake_get)
+    client = aiosolr.Client(collection="ignored")
+    check = client.check_dataimport_status_many(statuses, collection="ignored", max_retries=2)
+    if error is None:
+        await check
+    else:
+        with pytest.raises(error):
+            await check
+    assert set(checked) == set(statuses)
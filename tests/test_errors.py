@@ -0,0 +1,37 @@
+"""Tests for raising SolrError from Solr responses."""
+
+import types
+
+import pytest
+
+import aiosolr
+
+
+@pytest.mark.parametrize("params", [(200, b"{}"), (204, b""), (206, b"{}")])
+def test_ok_response_does_not_raise(params):
+    """Test a 2xx response passes the status check and deserializes, even without a body."""
+    status, body = params
+    response = types.SimpleNamespace(status=status, body=body)
+    aiosolr.Client._raise_for_status(response)
+    solr_response = aiosolr.Client()._deserialize(response)
+    assert solr_response.status == status
+    assert solr_response.data == {}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        (b'{"error": {"msg": "undefined field foo", "trace": "tb"}}', "undefined field foo", "tb"),
+        (b'{"error": {"code": 500}}', '{"error": {"code": 500}}', None),
+        (b"<html>Bad Gateway</html>", "<html>Bad Gateway</html>", None),
+        (b"[]", "[]", None),
+    ],
+)
+def test_error_response_raises(params):
+    """Test Solr's error message and trace are put on the SolrError."""
+    body, msg, trace = params
+    response = types.SimpleNamespace(status=400, body=body)
+    with pytest.raises(aiosolr.SolrError) as excinfo:
+        aiosolr.Client._raise_for_status(response)
+    assert str(excinfo.value) == msg
+    assert excinfo.value.trace == trace
@@ -0,0 +1,43 @@
+"""Tests for the request headers sent to Solr."""
+
+import json
+
+import aiosolr
+
+
+async def test_get_headers_are_not_mutated(solr):
+    """Test a body request leaves the default and caller supplied headers untouched."""
+    json_headers = dict(aiosolr._JSON_HEADERS)
+    json_body_headers = dict(aiosolr._JSON_BODY_HEADERS)
+    headers = {"X-Request-Id": "1"}
+    url = solr.client._url("books", "select")
+
+    await solr.client._get(url, body={"params": {"q": "*"}}, headers=headers)
+    await solr.client._get(url, body={"params": {"q": "*"}})
+    await solr.client._get(url)
+
+    assert aiosolr._JSON_HEADERS == json_headers
+    assert aiosolr._JSON_BODY_HEADERS == json_body_headers
+    assert headers == {"X-Request-Id": "1"}
+    first, second, third = solr.requests
+    assert first.headers["Content-Type"] == "application/json"
+    assert first.headers["X-Request-Id"] == "1"
+    assert second.headers["Content-Type"] == "application/json"
+    assert "Content-Type" not in third.headers
+    assert "X-Request-Id" not in third.headers
+
+
+async def test_post_headers_are_not_mutated(solr):
+    """Test posting json and xml sets the content type without changing the caller's headers."""
+    headers = {"X-Request-Id": "1"}
+    url = solr.client._url("books", "update")
+
+    await solr.client._post(url, [{"id": 1}], headers=headers)
+    await solr.client._post(url, "<add><doc/></add>", headers=headers)
+
+    assert headers == {"X-Request-Id": "1"}
+    json_request, xml_request = solr.requests
+    assert json_request.headers["Content-Type"] == "application/json"
+    assert json.loads(json_request.body) == [{"id": 1}]
+    assert xml_request.headers["Content-Type"] == "text/xml"
+    assert xml_request.body == b"<add><doc/></add>"
@@ -0,0 +1,104 @@
+"""Tests for the concurrent get_many, query_many and update_many methods."""
+
+import asyncio
+import gc
+import json
+
+import pytest
+from aiohttp import web
+
+import aiosolr
+
+
+class GetHandler:  # pylint: disable=too-few-public-methods
+    """Answer get requests with the requested doc, slowest first, tracking requests in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request):
+        _id = request.query["id"]
+        if _id == "bad":
+            return web.json_response({"error": {"msg": "bad id"}}, status=400)
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # Later ids answer sooner so results come back out of order
+        await asyncio.sleep(0.05 / int(_id))
+        self.in_flight -= 1
+        return web.json_response({"doc": {"id": _id}})
+
+
+async def test_get_many_order_and_concurrency(solr):
+    """Test responses come back in the order of the ids with at most concurrency in flight."""
+    solr.responder = handler = GetHandler()
+    ids = ["1", "2", "3", "4", "5", "6"]
+
+    responses = await solr.client.get_many(ids, concurrency=2)
+
+    assert [response.doc["id"] for response in responses] == ids
+    assert handler.max_in_flight == 2
+
+
+@pytest.mark.parametrize("return_exceptions", [True, False])
+async def test_get_many_errors(solr, return_exceptions):
+    """Test errors are returned in place or raised depending on return_exceptions."""
+    solr.responder = GetHandler()
+
+    if return_exceptions:
+        responses = await solr.client.get_many(["1", "bad", "2"], return_exceptions=True)
+        assert responses[0].doc == {"id": "1"}
+        assert isinstance(responses[1], aiosolr.SolrError)
+        assert str(responses[1]) == "bad id"
+        assert responses[2].doc == {"id": "2"}
+    else:
+        with pytest.raises(aiosolr.SolrError, match="bad id"):
+            await solr.client.get_many(["1", "bad", "2"])
+
+
+async def test_query_many(solr):
+    """Test each query's kwargs are sent with its own request and results keep their order."""
+
+    async def echo_response(request):
+        q = json.loads(await request.read())["params"]["q"]
+        return web.json_response({"response": {"numFound": 1, "docs": [{"id": q}]}})
+
+    solr.responder = echo_response
+    responses = await solr.client.query_many([{"query": "a"}, {"query": "b"}, {"q": "c"}])
+
+    assert [response.docs[0]["id"] for response in responses] == ["a", "b", "c"]
+
+
+async def test_update_many(solr):
+    """Test every batch is posted with the shared kwargs."""
+    batches = [[{"id": "1"}], [{"id": "2"}]]
+
+    responses = await solr.client.update_many(batches, commit="true")
+
+    assert len(responses) == 2
+    assert sorted(json.loads(request.body)[0]["id"] for request in solr.requests) == ["1", "2"]
+    assert all(request.query["commit"] == "true" for request in solr.requests)
+
+
+async def test_many_setup_failure(monkeypatch, recwarn):
+    """Test no request coroutine is left unawaited when the session can't be set up."""
+
+    async def failing_setup(self):
+        raise aiosolr.SolrError("no session")
+
+    monkeypatch.setattr(aiosolr.Client, "setup", failing_setup)
+    client = aiosolr.Client(collection="books")
+    with pytest.raises(aiosolr.SolrError, match="no session"):
+        await client.get_many(["1", "2", "3"])
+    gc.collect()
+
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_many_invalid_concurrency(concurrency):
+    """Test a concurrency below 1 is rejected instead of waiting forever."""
+    client = aiosolr.Client(collection="books")
+    with pytest.raises(aiosolr.SolrError):
+        await asyncio.wait_for(client.get_many(["1"], concurrency=concurrency), 1)
@@ -0,0 +1,40 @@
+"""Tests for the _kwargs_to_query_string static method."""
+
+import urllib.parse
+
+import pytest
+
+import aiosolr
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        ({}, ""),
+        ({"q": "hello world"}, "&q=hello+world"),
+        ({"rows": 10, "start": 0}, "&rows=10&start=0"),
+        ({"spellcheck": True, "debug": False}, "&spellcheck=true&debug=false"),
+        ({"fl": ["id", "name"]}, "&fl=id%2Cname"),
+        ({"fl": ("id", "name")}, "&fl=id%2Cname"),
+        ({"fq": ("type:book", "lang:en")}, "&fq=type%3Abook&fq=lang%3Aen"),
+        ({"fl": {"id"}}, "&fl=%7B%27id%27%7D"),
+        ({"qf": ["title^2", "body"]}, "&qf=title%5E2+body"),
+        ({"q": "a&b", "fq": ["type:book", "lang:en"]}, "&fq=type%3Abook&fq=lang%3Aen&q=a%26b"),
+    ],
+)
+def test_kwargs_to_query_string(params):
+    """Test kwargs are encoded into a Solr query string."""
+    kwargs, expected = params
+    assert aiosolr.Client._kwargs_to_query_string(kwargs) == expected
+
+
+def test_multi_valued_params_round_trip():
+    """Test repeated params decode back to their original values."""
+    kwargs = {"fq": ["a:1", "b:2"], "facet.field": ["x", "y"], "boost": ["z"], "q": "*"}
+    query_string = aiosolr.Client._kwargs_to_query_string(dict(kwargs))
+    assert urllib.parse.parse_qs(query_string.lstrip("&")) == {
+        "fq": ["a:1", "b:2"],
+        "facet.field": ["x", "y"],
+        "boost": ["z"],
+        "q": ["*"],
+    }
@@ -0,0 +1,35 @@
+"""Tests for the Response class."""
+
+import aiosolr
+
+
+def test_spelling_suggestions():
+    """Test spellcheck collations and suggestions are merged without duplicates."""
+    data = {
+        "spellcheck": {
+            "collations": ["collation", "jesus wept"],
+            "suggestions": [
+                "jesis",
+                {"numFound": 2, "suggestion": ["jesus", "jesse", "jesus"]},
+                "wep",
+                {"numFound": 2, "suggestion": ["wept", "jesus wept"]},
+            ],
+        }
+    }
+    response = aiosolr.Response(data, 200)
+    assert response.spelling_suggestions == ["jesus wept", "jesus", "jesse", "wept"]
+
+
+def test_get():
+    """Test attributes are returned by get with a default for unknown names."""
+    response = aiosolr.Response({"response": {"docs": [{"id": 1}]}}, 200)
+    assert response.get("docs") == [{"id": 1}]
+    assert response.get("status") == 200
+    assert response.get("missing", "default") == "default"
+
+
+def test_more_like_this():
+    """Test more like this docs are taken from the first MLT block."""
+    data = {"moreLikeThis": {"doc1": {"numFound": 1, "docs": [{"id": "doc2"}]}}}
+    response = aiosolr.Response(data, 200)
+    assert response.more_like_this == [{"id": "doc2"}]
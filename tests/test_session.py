@@ -0,0 +1,97 @@
+"""Tests for the Client session handling."""
+
+import asyncio
+import gc
+import weakref
+
+import pytest
+
+import aiosolr
+
+
+async def test_shared_session():
+    """Test shared clients reuse one session until it is closed."""
+    books = aiosolr.Client(collection="books", shared_session=True)
+    authors = aiosolr.Client(collection="authors", shared_session=True)
+    await books.setup()
+    await authors.setup()
+    assert books.session is authors.session
+
+    session = books.session
+    await books.close()
+    assert not session.closed
+
+    await aiosolr.Client.close_shared_session()
+    assert session.closed
+
+
+async def test_shared_session_outlives_clients():
+    """Test the shared session stays open and is reused after every shared client is gone."""
+    books = aiosolr.Client(collection="books", shared_session=True)
+    await books.setup()
+    # Only a weak reference so the test itself doesn't keep the session alive
+    session_ref = weakref.ref(books.session)
+    await books.close()
+    del books
+    gc.collect()
+
+    session = session_ref()
+    assert session is not None
+    assert not session.closed
+    authors = aiosolr.Client(collection="authors", shared_session=True)
+    await authors.setup()
+    assert authors.session is session
+
+    await aiosolr.Client.close_shared_session()
+    assert session.closed
+
+
+# The app below never closes the session, so aiohttp warns when the dropped session is collected
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnraisableExceptionWarning")
+def test_shared_session_of_closed_loop_is_dropped():
+    """Test the shared session of a loop which has since closed is forgotten."""
+
+    async def use_shared_session(close):
+        client = aiosolr.Client(collection="books", shared_session=True)
+        await client.setup()
+        assert asyncio.get_running_loop() in aiosolr.Client._shared_sessions
+        if close:
+            await aiosolr.Client.close_shared_session()
+        return asyncio.get_running_loop()
+
+    # An app running a loop per job which never closes the shared session
+    first_loop = asyncio.run(use_shared_session(close=False))
+    asyncio.run(use_shared_session(close=True))
+    assert first_loop not in aiosolr.Client._shared_sessions
+
+
+async def test_unshared_session():
+    """Test clients get their own session by default."""
+    books = aiosolr.Client(collection="books")
+    authors = aiosolr.Client(collection="authors")
+    await books.setup()
+    await authors.setup()
+    assert books.session is not authors.session
+    await books.close()
+    await authors.close()
+
+
+async def test_lazy_session():
+    """Test concurrent first requests share one session which is set up again once closed."""
+    client = aiosolr.Client(collection="books")
+    first, second = await asyncio.gather(client._get_session(), client._get_session())
+    assert first is second
+
+    await client.close()
+    session = await client._get_session()
+    assert session is not first
+    assert not session.closed
+    await client.close()
+
+
+async def test_context_manager():
+    """Test the session is closed when leaving the async with block."""
+    async with aiosolr.Client(collection="books") as client:
+        session = await client._get_session()
+        assert not session.closed
+    assert session.closed
@@ -0,0 +1,82 @@
+"""Tests for streaming query results."""
+
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+
+import aiosolr
+
+DOCS = [{"id": "1", "score": 1.5}, {"id": "2", "score": 0.5}]
+
+
+async def docs_response(request):  # pylint: disable=unused-argument
+    """Answer with a query response holding DOCS."""
+    return web.json_response({"response": {"numFound": len(DOCS), "docs": DOCS}})
+
+
+async def test_stream_select(solr):
+    """Test the select handler posts query's params in the body and streams the docs."""
+    solr.responder = docs_response
+    docs = [
+        doc
+        async for doc in solr.client.query_stream(
+            query="jesus", fq=["a:1"], spellcheck=True, spellcheck_dicts=["default"]
+        )
+    ]
+
+    assert docs == DOCS
+    (request,) = solr.requests
+    assert request.method == "POST"
+    assert request.path == "/solr/books/select"
+    assert json.loads(request.body) == {
+        "params": {
+            "q": "jesus",
+            "fq": ["a:1"],
+            "spellcheck": True,
+            "spellcheck.q": "jesus",
+            "spellcheck.dictionary": ["default"],
+        }
+    }
+
+
+async def test_stream_query_string(solr):
+    """Test handlers without body support get query's params in the url."""
+    solr.responder = docs_response
+    docs = [
+        doc async for doc in solr.client.query_stream(handler="mlt", q="id:1", prefer_local=True)
+    ]
+
+    assert docs == DOCS
+    (request,) = solr.requests
+    assert request.method == "GET"
+    assert request.path == "/solr/books/mlt"
+    assert request.query["q"] == "id:1"
+    assert request.query["shards.preference"] == "replica.location:local"
+    assert "prefer_local" not in request.query
+
+
+async def test_stream_error(solr):
+    """Test an error response raises a SolrError with Solr's message."""
+
+    async def error_response(request):  # pylint: disable=unused-argument
+        return web.json_response({"error": {"msg": "undefined field foo"}}, status=400)
+
+    solr.responder = error_response
+    with pytest.raises(aiosolr.SolrError, match="undefined field foo"):
+        async for _ in solr.client.query_stream(query="foo:bar"):
+            pass
+
+
+async def test_stream_read_timeout(solr):
+    """Test read_timeout limits the wait for the response."""
+
+    async def slow_response(request):
+        await asyncio.sleep(0.5)
+        return await docs_response(request)
+
+    solr.responder = slow_response
+    with pytest.raises(asyncio.TimeoutError):
+        async for _ in solr.client.query_stream(read_timeout=0.1):
+            pass
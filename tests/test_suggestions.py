@@ -0,0 +1,44 @@
+"""Tests for collecting suggestions from the SuggestComponent response."""
+
+import pytest
+
+import aiosolr
+
+SUGGEST_DATA = {
+    "suggest": {
+        "title": {
+            "jo": {
+                "numFound": 2,
+                "suggestions": [
+                    {"term": "john", "weight": 2, "payload": "1"},
+                    {"term": "joshua", "weight": 1, "payload": "2"},
+                ],
+            }
+        },
+        "broken": {"jo": {"numFound": 1, "suggestions": [{"term": "job", "weight": 1}]}},
+        "other": {"ju": {"numFound": 0, "suggestions": []}},
+    }
+}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        (
+            False,
+            [{"match": "john", "payload": "1"}, {"match": "joshua", "payload": "2"}],
+        ),
+        (True, {"match": ["john", "joshua"], "payload": ["1", "2"]}),
+    ],
+)
+async def test_suggestions(params, monkeypatch):
+    """Test suggestions are gathered from every suggester, skipping malformed ones."""
+    columnar, expected = params
+    client = aiosolr.Client(collection="books")
+
+    async def fake_get(url):  # pylint: disable=unused-argument
+        return aiosolr.Response(SUGGEST_DATA, 200)
+
+    monkeypatch.setattr(client, "_get_check_ok_deserialize", fake_get)
+    _, suggestions = await client.suggestions("suggest", query="jo", columnar=columnar)
+    assert suggestions == expected